@@ -0,0 +1,181 @@
+# cython: language_level=3
+"""
+Hidden File Detector - Native Traversal Kernel (optional, POSIX only)
+Build in place with: cythonize -i detector_core.pyx
+hidden_file_detector.py falls back to pure Python when this isn't built
+"""
+
+import os
+
+from libc.errno cimport errno
+from libc.string cimport memcmp, strlen, strstr
+from posix.fcntl cimport AT_SYMLINK_NOFOLLOW
+from posix.stat cimport struct_stat, fstatat, S_ISDIR, S_ISLNK
+
+cdef extern from "dirent.h" nogil:
+    ctypedef struct DIR:
+        pass
+    struct dirent:
+        unsigned char d_type
+        char d_name[256]
+    DIR *opendir(const char *name)
+    dirent *readdir(DIR *dirp)
+    int closedir(DIR *dirp)
+    int dirfd(DIR *dirp)
+    enum:
+        DT_UNKNOWN
+        DT_DIR
+        DT_LNK
+
+# Item types, same values as KIND_* in hidden_file_detector.py
+cdef enum:
+    KIND_DIR = 0
+    KIND_FILE = 1
+    KIND_FLAG = 2
+
+cdef bint is_flag_name(const char *name, list keywords, list extensions):
+    """Same test as is_potential_flag, on an ASCII-lowercased copy"""
+    cdef char lower[256]
+    cdef size_t length = strlen(name)
+    cdef size_t i
+    cdef size_t ext_length
+    cdef char c
+    cdef bytes pattern
+
+    if length > 255:
+        length = 255
+    for i in range(length):
+        c = name[i]
+        lower[i] = c + 32 if 65 <= c <= 90 else c  # 'A'..'Z'
+    lower[length] = 0
+
+    # Check for flag keywords
+    for pattern in keywords:
+        if strstr(lower, pattern) != NULL:
+            return True
+
+    # Check for suspicious extensions
+    for pattern in extensions:
+        ext_length = len(pattern)
+        if length >= ext_length and memcmp(lower + length - ext_length, <const char *>pattern, ext_length) == 0:
+            return True
+
+    return False
+
+cdef int scan_dir(bytes current, list keyword_list, list extension_list,
+                  list results, list subdirs) except -1:
+    """List one directory, appending its hits to results and its
+    subdirectories (in listing order) to subdirs
+
+    Returns 0, or the errno from opendir.
+    Entry types come from d_type, so only hits (and entries on
+    filesystems without d_type) are stat'd, relative to the directory fd;
+    symlinks are resolved only for hits, as in the Python walker.
+    """
+    cdef bytes prefix, path
+    cdef DIR *d
+    cdef dirent *ent
+    cdef struct_stat st
+    cdef const char *name
+    cdef int fd
+    cdef unsigned char d_type
+    cdef bint hidden, is_dir, is_link, found
+
+    d = opendir(current)
+    if d == NULL:
+        return errno
+
+    fd = dirfd(d)
+    prefix = current if current.endswith(b'/') else current + b'/'
+    try:
+        while True:
+            ent = readdir(d)
+            if ent == NULL:
+                break
+
+            name = ent.d_name
+            if name[0] == 46 and (name[1] == 0 or (name[1] == 46 and name[2] == 0)):
+                continue  # '.' and '..'
+            hidden = name[0] == 46
+
+            # Classify from d_type; stat only when the filesystem doesn't say
+            d_type = ent.d_type
+            is_link = d_type == DT_LNK
+            is_dir = d_type == DT_DIR
+            if d_type == DT_UNKNOWN and fstatat(fd, name, &st, AT_SYMLINK_NOFOLLOW) == 0:
+                is_link = S_ISLNK(st.st_mode)
+                is_dir = S_ISDIR(st.st_mode)
+
+            # Check directories
+            if is_dir:
+                path = prefix + name
+                if hidden:
+                    results.append((KIND_DIR, path, 0))
+                subdirs.append(path)
+                continue
+
+            # Check files by name first; only hits are stat'd
+            if not hidden and not is_flag_name(name, keyword_list, extension_list):
+                continue
+            found = fstatat(fd, name, &st, 0) == 0
+
+            # Symlinked directories are listed, not followed. Looping or
+            # unreadable targets are reported as files of size 0
+            if is_link and found and S_ISDIR(st.st_mode):
+                if hidden:
+                    results.append((KIND_DIR, prefix + name, 0))
+                continue
+
+            results.append((
+                KIND_FILE if hidden else KIND_FLAG,
+                prefix + name,
+                st.st_size if found else 0
+            ))
+    finally:
+        closedir(d)
+
+    return 0
+
+def scan_dir_c(bytes path, keywords, extensions):
+    """Scan a single directory, returning (items, subdirs)
+
+    items are (item_type, path_bytes, size) tuples like walk_c; subdirs
+    are path bytes in listing order. Lets callers that keep per-directory
+    state (the auto-mode scan cache) use the kernel a directory at a time.
+    """
+    cdef list results = []
+    cdef list subdirs = []
+    cdef int error = scan_dir(path, [bytes(k) for k in keywords],
+                              [bytes(e) for e in extensions], results, subdirs)
+    if error:
+        raise OSError(error, os.strerror(error), os.fsdecode(path))
+    return results, subdirs
+
+def walk_c(bytes root, keywords, extensions):
+    """Walk a directory tree with opendir/readdir and return hits
+
+    Returns (item_type, path_bytes, size) tuples like scan_directory.
+    keywords/extensions are lowercase bytes patterns.
+    """
+    cdef list results = []
+    cdef list stack = [root]
+    cdef list subdirs
+    cdef list keyword_list = [bytes(k) for k in keywords]
+    cdef list extension_list = [bytes(e) for e in extensions]
+    cdef bytes current
+    cdef int error
+
+    while stack:
+        current = stack.pop()
+        subdirs = []
+        error = scan_dir(current, keyword_list, extension_list, results, subdirs)
+        if error:
+            if current is root:
+                raise OSError(error, os.strerror(error), os.fsdecode(root))
+            continue  # Skip unreadable subdirectories like os.walk
+
+        # Keep top-down order of os.walk
+        subdirs.reverse()
+        stack.extend(subdirs)
+
+    return results
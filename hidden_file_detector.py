@@ -6,162 +6,540 @@ Works with Python 2.7+ and Python 3.x
 Compatible with older Windows, Linux, and macOS systems
 """
 
+import atexit
+import json
 import os
+import platform
+import re
 import sys
 import stat
+import threading
+import time
+from bisect import bisect_right
+from itertools import chain
 
-# Python 2/3 compatibility
+# Python 2/3 compatibility (a separate name, so builtins are never rebound)
 try:
-    input = raw_input  # Python 2
+    read_input = raw_input  # type: ignore  # Python 2
 except NameError:
-    raw_input = input  # Python 3
+    read_input = input  # Python 3
 
-def get_system():
-    """Get operating system name (compatible way)"""
-    import platform
-    return platform.system()
+# Annotations are type comments so the module still runs on Python 2 and
+# can be checked with mypy or compiled with mypyc
+try:
+    from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+    ScanItem = Tuple[int, str, int]  # (item_type, path, size)
+except ImportError:
+    pass
 
-def is_hidden_file(file_path):
-    """Check if file is hidden (cross-platform, legacy compatible)"""
+# Platform checks are fixed for the process, so resolve them once
+_SYSTEM = platform.system()
+_IS_WINDOWS = _SYSTEM == "Windows"
+_HAS_FILE_ATTRIBUTES = hasattr(os.stat_result, 'st_file_attributes')  # Windows, Python 3.5+
+
+try:
+    from concurrent.futures import ThreadPoolExecutor  # Python 3.2+ / futures backport
+except ImportError:
+    ThreadPoolExecutor = None  # type: ignore
+
+# Keeps console output of concurrent scans from interleaving
+_print_lock = threading.Lock()
+
+# Path <-> bytes conversion for native calls (Python 2 paths are already bytes)
+_fsencode = getattr(os, 'fsencode', lambda path: path)
+_fsdecode = getattr(os, 'fsdecode', lambda path: path)
+
+# Directory listing with cached entry metadata
+scandir = getattr(os, 'scandir', None)  # Python 3.5+
+if scandir is None:
     try:
-        system = get_system()
+        import scandir as _scandir_backport  # type: ignore  # Package for Python 2.7
+        scandir = _scandir_backport.scandir
+    except ImportError:
+        pass
+
+# On POSIX (Python 3.7+) scandir accepts an open directory fd; entry stats
+# then use fstatat() relative to it instead of resolving full paths
+_SCANDIR_FD = scandir is not None and scandir in getattr(os, 'supports_fd', ())
+_DIR_OPEN_FLAGS = os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0) | getattr(os, 'O_CLOEXEC', 0)
+
+class _ListdirEntry(object):
+    """Minimal os.DirEntry stand-in for Pythons without scandir"""
+    def __init__(self, root, name):
+        # type: (str, str) -> None
+        self.name = name
+        self.path = os.path.join(root, name)
+        self._stat = None  # type: Optional[os.stat_result]
+        self._lstat = None  # type: Optional[os.stat_result]
+
+    def stat(self, follow_symlinks=True):
+        # type: (bool) -> os.stat_result
+        if follow_symlinks:
+            if self._stat is None:
+                self._stat = os.stat(self.path)
+            return self._stat
+        if self._lstat is None:
+            self._lstat = os.lstat(self.path)
+        return self._lstat
+
+    def is_symlink(self):
+        # type: () -> bool
+        try:
+            return stat.S_ISLNK(self.stat(follow_symlinks=False).st_mode)
+        except OSError:
+            return False
+
+    def is_dir(self, follow_symlinks=True):
+        # type: (bool) -> bool
+        try:
+            return stat.S_ISDIR(self.stat(follow_symlinks=follow_symlinks).st_mode)
+        except OSError:
+            return False
+
+# Linux fast path: statx(2) asking only for type and size, without forcing
+# a sync on network filesystems. Set up once; None means use os.stat.
+_statx_size = None  # type: Optional[Callable[..., Optional[int]]]
+
+if sys.platform.startswith('linux'):
+    try:
+        import ctypes
+        import errno
+        
+        AT_FDCWD = -100
+        AT_STATX_DONT_SYNC = 0x4000
+        STATX_TYPE = 0x0001
+        STATX_SIZE = 0x0200
+        
+        # struct statx from <linux/stat.h> is 256 bytes; only stx_size (a
+        # __u64 at byte offset 40) is read, so it is viewed as 32 __u64s
+        _StatxBuffer = ctypes.c_uint64 * 32
+        STX_SIZE_INDEX = 5
+        
+        # glibc 2.28+ wrapper; avoids hardcoding per-arch syscall numbers.
+        # Arguments are plain ints/bytes, so argtypes conversion is skipped.
+        _libc_statx = ctypes.CDLL(None, use_errno=True).statx
+        _statx_local = threading.local()  # One reusable buffer per thread
         
-        if system == "Windows":
+        def _statx_file_size(path, dir_fd=AT_FDCWD):
+            # type: (str, int) -> Optional[int]
+            """Get file size via statx, or None to fall back to os.stat"""
+            global _statx_size
             try:
-                # Try modern Windows method first
-                attrs = os.stat(file_path).st_file_attributes
-                return bool(attrs & 0x02)  # FILE_ATTRIBUTE_HIDDEN = 0x02
+                buf = _statx_local.buf
             except AttributeError:
-                # Fallback for older Windows/Python
-                return os.path.basename(file_path).startswith('.')
-        else:
-            # Unix/Linux/macOS: Files starting with '.' are hidden
-            return os.path.basename(file_path).startswith('.')
+                buf = _statx_local.buf = _StatxBuffer()
             
-    except (OSError, AttributeError):
-        # Ultimate fallback for all systems
-        return os.path.basename(file_path).startswith('.')
+            if _libc_statx(dir_fd, _fsencode(path), AT_STATX_DONT_SYNC,
+                           STATX_TYPE | STATX_SIZE, ctypes.byref(buf)) == 0:
+                return buf[STX_SIZE_INDEX]
+            if ctypes.get_errno() == errno.ENOSYS:
+                _statx_size = None  # Kernel older than 4.11
+            return None
+        
+        _statx_size = _statx_file_size
+    except (ImportError, OSError, AttributeError):
+        _statx_size = None
+
+# Item types in scan results: (item_type, path, size) tuples
+KIND_DIR, KIND_FILE, KIND_FLAG = 0, 1, 2
+ITEM_LABELS = ("Hidden Directory", "Hidden File", "Potential Flag")
+
+# Common paths found missing are not probed again for a while
+PATH_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.hidden_file_detector_cache.json')
+PATH_CACHE_TTL = 60 * 60  # seconds
+
+# Auto mode remembers scan results per directory (invalidated by mtime)
+SCAN_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.hidden_file_detector_scan_cache.json')
+SCAN_CACHE_VERSION = 2  # Bump when the entry layout changes
+
+# The detector's own cache files live in $HOME (an auto-mode root) and are
+# left out of results
+_OWN_FILES = set([PATH_CACHE_FILE, SCAN_CACHE_FILE])
+
+# Filename patterns that suggest flags/secrets (matched case-insensitively)
+FLAG_KEYWORDS = [
+    'flag', 'secret', 'password', 'key', 'hint', 
+    'token', 'admin', 'config', 'backup', 'hidden'
+]
+
+SUSPICIOUS_EXTENSIONS = ['.bak', '.old', '.tmp', '.swp', '.orig']
+
+# Build the matcher once: a single Aho-Corasick pass when pyahocorasick is
+# installed, otherwise one precompiled regex alternation
+_FLAG_PATTERNS = FLAG_KEYWORDS + [ext + '\0' for ext in SUSPICIOUS_EXTENSIONS]
+
+try:
+    import ahocorasick  # type: ignore
+    _FLAG_AUTOMATON = ahocorasick.Automaton()
+    for _pattern in _FLAG_PATTERNS:
+        _FLAG_AUTOMATON.add_word(_pattern, _pattern)
+    _FLAG_AUTOMATON.make_automaton()
+except ImportError:
+    _FLAG_AUTOMATON = None
+
+_FLAG_RE = re.compile('|'.join(re.escape(pattern) for pattern in _FLAG_PATTERNS))
+
+# Optional compiled traversal kernel (build with: cythonize -i detector_core.pyx)
+try:
+    from detector_core import walk_c, scan_dir_c  # type: ignore
+    _FLAG_KEYWORDS_BYTES = [keyword.encode('ascii') for keyword in FLAG_KEYWORDS]
+    _FLAG_EXTENSIONS_BYTES = [ext.encode('ascii') for ext in SUSPICIOUS_EXTENSIONS]
+except ImportError:
+    walk_c = scan_dir_c = None
+
+def list_entries(directory_path, dir_fd=None):
+    # type: (str, Optional[int]) -> List[Any]
+    """List directory entries (scandir when available, listdir fallback)"""
+    if scandir is not None:
+        # An open directory fd (see _SCANDIR_FD) is listed instead of the path
+        return list(scandir(directory_path if dir_fd is None else dir_fd))
+    return [_ListdirEntry(directory_path, name) for name in os.listdir(directory_path)]
+
+def get_system():
+    # type: () -> str
+    """Get operating system name (compatible way)"""
+    return _SYSTEM
+
+def is_hidden(st, name):
+    # type: (Optional[os.stat_result], str) -> bool
+    """Check if an entry is hidden from its stat result and name (cross-platform)"""
+    if st is not None and _HAS_FILE_ATTRIBUTES:
+        # Modern Windows method
+        return bool(st.st_file_attributes & 0x02)  # type: ignore  # FILE_ATTRIBUTE_HIDDEN = 0x02
+    
+    # Unix/Linux/macOS and older Windows/Python: '.' prefix means hidden
+    # (slice compare avoids a method call and is safe for empty names)
+    return name[:1] == '.'
 
 def is_potential_flag(filename):
+    # type: (str) -> bool
     """Check if filename suggests it might contain a flag"""
-    flag_keywords = [
-        'flag', 'secret', 'password', 'key', 'hint', 
-        'token', 'admin', 'config', 'backup', 'hidden'
-    ]
+    # Names are NUL-terminated so extension patterns only match at the end
+    name_key = filename.lower() + '\0'
     
-    suspicious_extensions = ['.bak', '.old', '.tmp', '.swp', '.orig']
+    if _FLAG_AUTOMATON is not None:
+        return next(_FLAG_AUTOMATON.iter(name_key), None) is not None
+    return _FLAG_RE.search(name_key) is not None
+
+def find_potential_flags(filenames):
+    # type: (List[str]) -> Set[int]
+    """Return indices of filenames that suggest flags, in one scan over all names"""
+    # One NUL-separated blob: keywords can't span names and extension
+    # patterns still only match at the end of a name
+    blob = '\0'.join(filenames).lower() + '\0'
     
-    filename_lower = filename.lower()
+    starts = []
+    position = 0
+    for filename in filenames:
+        starts.append(position)
+        position += len(filename) + 1
     
-    # Check for flag keywords
-    for keyword in flag_keywords:
-        if keyword in filename_lower:
-            return True
+    if position != len(blob):
+        # Lowercasing changed some lengths (rare non-ASCII); check one by one
+        return set(index for index, filename in enumerate(filenames)
+                   if is_potential_flag(filename))
     
-    # Check for suspicious extensions
-    for ext in suspicious_extensions:
-        if filename_lower.endswith(ext):
-            return True
+    if _FLAG_AUTOMATON is not None:
+        offsets = (end for end, pattern in _FLAG_AUTOMATON.iter(blob))
+    else:
+        offsets = (match.start() for match in _FLAG_RE.finditer(blob))
     
-    return False
+    return set(bisect_right(starts, offset) - 1 for offset in offsets)
 
-def get_file_size(file_path):
-    """Get file size safely"""
+def get_entry_size(entry, st=None, dir_fd=None):
+    # type: (Any, Optional[os.stat_result], Optional[int]) -> int
+    """Get file size of a directory entry safely (one stat at most)"""
+    if st is not None:
+        return st.st_size
+    
+    if _statx_size is not None:
+        if dir_fd is not None:
+            size = _statx_size(entry.name, dir_fd)
+        else:
+            size = _statx_size(entry.path)
+        if size is not None:
+            return size
+    
+    try:
+        return entry.stat().st_size
+    except OSError:
+        return 0
+
+def get_path_size(file_path):
+    # type: (str) -> int
+    """Get file size of a path safely, following symlinks like get_entry_size"""
+    if _statx_size is not None:
+        size = _statx_size(file_path)
+        if size is not None:
+            return size
+    
     try:
         return os.path.getsize(file_path)
-    except (OSError, IOError):
+    except OSError:
         return 0
 
-def scan_directory(directory_path):
-    """Scan directory for hidden files (compatible with old Python)"""
-    hidden_items = []
-    system = get_system()
+def scan_listing(current, entries, dir_fd=None):
+    # type: (str, List[Any], Optional[int]) -> Tuple[List[ScanItem], List[str]]
+    """Classify one directory listing, returning (items, subdirs)"""
+    items = []
+    subdirs = []
+    files = []
+    for entry in entries:
+        # Windows reads the hidden attribute from the stat result
+        # (cached by scandir there); elsewhere the name is enough
+        st = None
+        if _HAS_FILE_ATTRIBUTES:
+            try:
+                st = entry.stat()
+            except OSError:
+                pass
+        
+        # Check directories (type comes from the listing, no stat needed)
+        try:
+            is_dir = entry.is_dir(follow_symlinks=False)
+        except OSError:
+            is_dir = False  # Same as os.walk
+        
+        if is_dir:
+            dir_path = os.path.join(current, entry.name)
+            if is_hidden(st, entry.name):
+                items.append((KIND_DIR, dir_path, 0))
+            subdirs.append(dir_path)
+            continue
+        
+        files.append((entry, st))
     
-    print("=" * 50)
-    print("Hidden File Detector - Legacy Compatible")
-    print("Directory: " + directory_path)
-    print("System: " + system)
-    print("=" * 50)
+    # Match flag patterns against all file names of the directory at once
+    flagged = find_potential_flags([entry.name for entry, st in files])
     
-    if not os.path.exists(directory_path):
-        print("ERROR: Directory not found - " + directory_path)
-        return hidden_items
+    # Check files by name first; only reported files get sized
+    for index, (entry, st) in enumerate(files):
+        # Check if hidden
+        if is_hidden(st, entry.name):
+            item_type = KIND_FILE
+        
+        # Check if potential flag
+        elif index in flagged:
+            item_type = KIND_FLAG
+        
+        else:
+            continue
+        
+        # Symlinked directories are listed like directories but not followed;
+        # resolving the target costs a stat, so it's only done for hits.
+        # Looping or unreadable targets are reported as files, like os.walk
+        try:
+            is_dir_link = entry.is_symlink() and entry.is_dir()
+        except OSError:
+            is_dir_link = False
+        
+        if is_dir_link:
+            if item_type == KIND_FILE:
+                items.append((KIND_DIR, os.path.join(current, entry.name), 0))
+            continue
+        
+        # Stats are relative to dir_fd when it is open
+        file_size = get_entry_size(entry, st, dir_fd)
+        items.append((item_type, os.path.join(current, entry.name), file_size))
     
+    return items, subdirs
+
+def scan_single_directory(directory_path):
+    # type: (str) -> Tuple[List[ScanItem], List[str]]
+    """Scan one directory (no recursion), returning (items, subdirs)"""
+    # The compiled kernel does the listing when it is built
+    if scan_dir_c is not None and not _IS_WINDOWS:
+        items, subdirs = scan_dir_c(_fsencode(directory_path), _FLAG_KEYWORDS_BYTES, _FLAG_EXTENSIONS_BYTES)
+        return ([(item_type, _fsdecode(file_path), file_size) for item_type, file_path, file_size in items],
+                [_fsdecode(subdir) for subdir in subdirs])
+    
+    dir_fd = None
     try:
-        # Walk through directory tree
-        for root, dirs, files in os.walk(directory_path):
-            
-            # Check directories
-            for dir_name in dirs:
-                dir_path = os.path.join(root, dir_name)
-                if is_hidden_file(dir_path):
-                    hidden_items.append(('Hidden Directory', dir_path, 0))
+        if _SCANDIR_FD:
+            dir_fd = os.open(directory_path, _DIR_OPEN_FLAGS)
+        entries = list_entries(directory_path, dir_fd)
+        return scan_listing(directory_path, entries, dir_fd)
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
+
+def walk_entries(directory_path, cache=None):
+    # type: (str, Optional[ScanCache]) -> Iterator[ScanItem]
+    """Walk directory tree a directory at a time, yielding (type, path, size) tuples"""
+    # Explicit stack of pending directories instead of recursion
+    stack = [directory_path]
+    while stack:
+        current = stack.pop()
+        
+        # Unchanged directories (same mtime as last run) come from the cache
+        cached = None
+        dir_mtime = None
+        if cache is not None:
+            try:
+                dir_stat = os.stat(current)
+                dir_mtime = getattr(dir_stat, 'st_mtime_ns', dir_stat.st_mtime)
+                cached = cache.lookup(current, dir_mtime)
+            except OSError:
+                pass
+        
+        if cached is not None:
+            # Writes to a file don't touch its directory's mtime, so hits
+            # are sized afresh
+            hits, subdirs = cached
+            items = [(kind, hit_path, 0 if kind == KIND_DIR else get_path_size(hit_path))
+                     for kind, hit_path in hits]
+        else:
+            try:
+                items, subdirs = scan_single_directory(current)
+            except OSError:
+                if current == directory_path:
+                    raise
+                continue  # Skip unreadable subdirectories like os.walk
             
-            # Check files
-            for file_name in files:
-                file_path = os.path.join(root, file_name)
-                file_size = get_file_size(file_path)
-                
-                # Check if hidden
-                if is_hidden_file(file_path):
-                    hidden_items.append(('Hidden File', file_path, file_size))
-                
-                # Check if potential flag
-                elif is_potential_flag(file_name):
-                    hidden_items.append(('Potential Flag', file_path, file_size))
+            if cache is not None and dir_mtime is not None:
+                cache.store(current, dir_mtime, items, subdirs)
+        
+        for item in items:
+            yield item
+        
+        # Keep top-down order of os.walk
+        stack.extend(reversed(subdirs))
+
+def walk_native(directory_path):
+    # type: (str) -> Iterator[ScanItem]
+    """Walk directory tree with the compiled detector_core kernel"""
+    results = walk_c(_fsencode(directory_path), _FLAG_KEYWORDS_BYTES, _FLAG_EXTENSIONS_BYTES)
+    for item_type, file_path, file_size in results:
+        yield (item_type, _fsdecode(file_path), file_size)
+
+def is_own_file(file_path):
+    # type: (str) -> bool
+    """Check if a path is one of the detector's own cache files"""
+    for own_file in _OWN_FILES:
+        # Cheap name test first; resolve the full path only on a match
+        if os.path.basename(file_path) == os.path.basename(own_file):
+            return os.path.abspath(file_path) == os.path.abspath(own_file)
+    return False
+
+def scan_directory(directory_path, cache=None):
+    # type: (str, Optional[ScanCache]) -> Iterator[ScanItem]
+    """Scan directory for hidden files, yielding (type, path, size) tuples"""
+    with _print_lock:
+        print("=" * 50)
+        print("Hidden File Detector - Legacy Compatible")
+        print("Directory: " + directory_path)
+        print("System: " + _SYSTEM)
+        print("=" * 50)
     
-    except OSError as e:
-        print("ERROR: Permission denied or access error")
-        print("Details: " + str(e))
+    if not os.path.exists(directory_path):
+        with _print_lock:
+            print("ERROR: Directory not found - " + directory_path)
+        return
     
-    return hidden_items
+    if cache is None and walk_c is not None and not _IS_WINDOWS:
+        items = walk_native(directory_path)
+    else:
+        items = walk_entries(directory_path, cache)
+    
+    try:
+        for item in items:
+            if is_own_file(item[1]):
+                continue
+            yield item
+    
+    except OSError as e:
+        with _print_lock:
+            print("ERROR: Permission denied or access error")
+            print("Details: " + str(e))
 
 def display_results(hidden_items):
+    # type: (List[ScanItem]) -> None
     """Display found items"""
     if not hidden_items:
         print("\nNo hidden files or suspicious items found!")
         return
     
-    print("\nFound " + str(len(hidden_items)) + " suspicious items:")
-    print("-" * 70)
+    lines = [
+        "\nFound " + str(len(hidden_items)) + " suspicious items:\n",
+        "-" * 70 + "\n"
+    ]
     
     for item_type, file_path, file_size in hidden_items:
-        size_kb = file_size / 1024.0 if file_size > 0 else 0
+        if item_type == KIND_DIR:
+            lines.append("[DIR]  " + file_path + "\n")
+            continue
+        
+        # Size in KB to one decimal, using integer arithmetic. Ties go to
+        # even like round(), which sees file_size / 1024.0 exactly
+        if file_size > 0:
+            tenths, remainder = divmod(file_size * 10, 1024)
+            if remainder > 512 or (remainder == 512 and tenths % 2):
+                tenths += 1
+            size_kb = str(tenths // 10) + "." + str(tenths % 10)
+        else:
+            size_kb = "0"
         
-        if item_type == 'Hidden Directory':
-            print("[DIR]  " + file_path)
-        elif item_type == 'Hidden File':
-            print("[HIDDEN] " + file_path + " (" + str(round(size_kb, 1)) + " KB)")
-        elif item_type == 'Potential Flag':
-            print("[FLAG?] " + file_path + " (" + str(round(size_kb, 1)) + " KB)")
+        if item_type == KIND_FILE:
+            lines.append("[HIDDEN] " + file_path + " (" + size_kb + " KB)\n")
+        elif item_type == KIND_FLAG:
+            lines.append("[FLAG?] " + file_path + " (" + size_kb + " KB)\n")
+    
+    # One write instead of a print per item
+    sys.stdout.write("".join(lines))
+
+def read_file_head(file_path, length):
+    # type: (str, int) -> Optional[bytes]
+    """Read up to length bytes with one raw read (no buffered/text layers)"""
+    flags = os.O_RDONLY | getattr(os, 'O_NOATIME', 0)  # Don't dirty atime
+    try:
+        try:
+            fd = os.open(file_path, flags)
+        except OSError:
+            # O_NOATIME is only allowed on files we own
+            fd = os.open(file_path, os.O_RDONLY)
+        try:
+            return os.read(fd, length)
+        finally:
+            os.close(fd)
+    except OSError:
+        return None
 
 def preview_small_files(hidden_items):
+    # type: (List[ScanItem]) -> None
     """Show content preview for small text files"""
     print("\nContent Preview (small files only):")
     print("-" * 40)
     
     for item_type, file_path, file_size in hidden_items:
         if file_size > 0 and file_size < 500:  # Only small files
-            try:
-                with open(file_path, 'r') as f:
-                    content = f.read(100).strip()
-                    if content and len(content) > 5:
-                        filename = os.path.basename(file_path)
-                        print(filename + ": " + content[:80] + "...")
-            except (IOError, UnicodeDecodeError):
-                pass  # Skip binary or unreadable files
+            data = read_file_head(file_path, 100)
+            if not data or b'\0' in data:
+                continue  # Skip binary or unreadable files
+            
+            content = data.decode('utf-8', 'replace').strip()
+            if content and len(content) > 5:
+                filename = os.path.basename(file_path)
+                print(filename + ": " + content[:80] + "...")
 
 def save_report(hidden_items, output_file):
+    # type: (Iterable[ScanItem], str) -> bool
     """Save results to text file"""
     try:
-        with open(output_file, 'w') as f:
-            f.write("Hidden File Detection Report\n")
-            f.write("System: " + get_system() + "\n")
-            f.write("Total Items Found: " + str(len(hidden_items)) + "\n")
-            f.write("-" * 50 + "\n\n")
-            
-            for item_type, file_path, file_size in hidden_items:
-                f.write("[" + item_type + "] " + file_path + " (" + str(file_size) + " bytes)\n")
+        # Accepts any iterable of items, so count while formatting
+        lines = []
+        for item_type, file_path, file_size in hidden_items:
+            lines.append("[" + ITEM_LABELS[item_type] + "] " + file_path + " (" + str(file_size) + " bytes)\n")
+        
+        header = [
+            "Hidden File Detection Report\n",
+            "System: " + _SYSTEM + "\n",
+            "Total Items Found: " + str(len(lines)) + "\n",
+            "-" * 50 + "\n\n"
+        ]
+        
+        # Write the whole report at once
+        with open(output_file, 'w', buffering=1 << 20) as f:
+            f.write("".join(header + lines))
         
         print("Report saved to: " + output_file)
         return True
@@ -169,12 +547,85 @@ def save_report(hidden_items, output_file):
         print("ERROR: Could not save report file")
         return False
 
+def load_json_cache(cache_file):
+    # type: (str) -> Dict[str, Any]
+    """Load a JSON cache file, or an empty cache if missing/corrupt"""
+    try:
+        with open(cache_file, 'r') as f:
+            cache = json.load(f)
+        if isinstance(cache, dict):
+            return cache
+    except (IOError, OSError, ValueError):
+        pass
+    return {}
+
+def save_json_cache(cache_file, cache):
+    # type: (str, Dict[str, Any]) -> None
+    """Save a JSON cache file (best effort)"""
+    try:
+        with open(cache_file, 'w') as f:
+            json.dump(cache, f)
+    except (IOError, OSError):
+        pass
+
+# JSON strings load as unicode on Python 2
+_STRING_TYPES = (str, type(u''))
+
+def _is_valid_scan_entry(cached):
+    # type: (Any) -> bool
+    """Check a scan cache entry is [mtime, [[type, path], ...], [subdir, ...]]"""
+    if not isinstance(cached, list) or len(cached) != 3:
+        return False
+    if not isinstance(cached[1], list) or not isinstance(cached[2], list):
+        return False
+    for item in cached[1]:
+        if (not isinstance(item, list) or len(item) != 2 or
+                item[0] not in (KIND_DIR, KIND_FILE, KIND_FLAG) or
+                not isinstance(item[1], _STRING_TYPES)):
+            return False
+    for subdir in cached[2]:
+        if not isinstance(subdir, _STRING_TYPES):
+            return False
+    return True
+
+class ScanCache(object):
+    """Per-directory scan results kept between runs, valid while mtime matches"""
+    def __init__(self, cache_file):
+        # type: (str) -> None
+        self.cache_file = cache_file
+        self.previous = {}  # type: Dict[str, Any]
+        self.current = {}  # type: Dict[str, Any]  # Only directories seen this run are saved again
+        
+        # Files from another version (or hand-edited into shape) start empty
+        cache = load_json_cache(cache_file)
+        directories = cache.get('directories')
+        if cache.get('version') == SCAN_CACHE_VERSION and isinstance(directories, dict):
+            self.previous = directories
+
+    def lookup(self, directory_path, mtime):
+        # type: (str, float) -> Optional[Tuple[List[Tuple[int, str]], List[str]]]
+        """Return cached ((type, path) hits, subdirs), or None if missing, stale or malformed"""
+        cached = self.previous.get(directory_path)  # type: Any
+        if not _is_valid_scan_entry(cached) or cached[0] != mtime:
+            return None
+        self.current[directory_path] = cached
+        return [(item[0], item[1]) for item in cached[1]], cached[2]
+
+    def store(self, directory_path, mtime, items, subdirs):
+        # type: (str, float, List[ScanItem], List[str]) -> None
+        """Remember a directory's hits without their sizes, which can go stale"""
+        self.current[directory_path] = [mtime, [[kind, item_path] for kind, item_path, _ in items], subdirs]
+
+    def save(self):
+        # type: () -> None
+        save_json_cache(self.cache_file, {'version': SCAN_CACHE_VERSION, 'directories': self.current})
+
 def get_common_paths():
+    # type: () -> List[str]
     """Get common paths where flags/secrets are hidden"""
-    system = get_system()
     paths = []
     
-    if system == "Windows":
+    if _IS_WINDOWS:
         # Windows common paths
         username = os.environ.get('USERNAME', 'user')
         paths = [
@@ -199,15 +650,67 @@ def get_common_paths():
             '/usr/local'
         ]
     
+    # Skip paths recently seen missing, probe the rest concurrently
+    now = time.time()
+    cache = load_json_cache(PATH_CACHE_FILE)
+    missing = cache.get('missing')
+    if not isinstance(missing, dict):
+        missing = cache['missing'] = {}
+    candidates = []
+    for path in paths:
+        seen_missing = missing.get(path)
+        if not isinstance(seen_missing, (int, float)) or seen_missing > now:
+            seen_missing = 0  # Not recorded, or corrupt: probe again
+        if now - seen_missing > PATH_CACHE_TTL:
+            candidates.append(path)
+    
+    if ThreadPoolExecutor is not None and len(candidates) > 1:
+        with ThreadPoolExecutor(max_workers=len(candidates)) as executor:
+            found = list(executor.map(os.path.exists, candidates))
+    else:
+        found = [os.path.exists(path) for path in candidates]
+    
     # Filter to existing paths only
     existing_paths = []
-    for path in paths:
-        if os.path.exists(path):
+    for path, exists in zip(candidates, found):
+        if exists:
             existing_paths.append(path)
+            missing.pop(path, None)
+        else:
+            missing[path] = now
+    
+    if candidates:
+        save_json_cache(PATH_CACHE_FILE, cache)
     
     return existing_paths
 
+def scan_common_paths():
+    # type: () -> List[ScanItem]
+    """Scan all common paths, overlapping their I/O in a thread pool"""
+    print("\nScanning common hiding locations...")
+    common_paths = get_common_paths()
+    
+    for path in common_paths:
+        print("Checking: " + path)
+    
+    # Repeat auto scans reuse results for directories that haven't changed.
+    # Not on Windows, where toggling the hidden attribute leaves the mtime alone
+    cache = None  # type: Optional[ScanCache]
+    if not _HAS_FILE_ATTRIBUTES:
+        cache = ScanCache(SCAN_CACHE_FILE)
+        atexit.register(cache.save)
+    
+    if ThreadPoolExecutor is None or len(common_paths) < 2:
+        return list(chain.from_iterable(scan_directory(path, cache) for path in common_paths))
+    
+    # Scans block in stat/readdir syscalls, which release the GIL; each
+    # worker drains its own generator
+    with ThreadPoolExecutor(max_workers=min(8, len(common_paths))) as executor:
+        results = executor.map(lambda path: list(scan_directory(path, cache)), common_paths)
+        return list(chain.from_iterable(results))
+
 def main():
+    # type: () -> None
     """Main function - legacy compatible"""
     print("Hidden File Detector v2.0 (Legacy Compatible)")
     print("Works with Python 2.7+ and Python 3.x")
@@ -218,15 +721,7 @@ def main():
         
         # Special shortcuts
         if scan_path.lower() in ['auto', 'common', 'smart']:
-            print("\nScanning common hiding locations...")
-            common_paths = get_common_paths()
-            all_items = []
-            
-            for path in common_paths:
-                print("Checking: " + path)
-                items = scan_directory(path)
-                all_items.extend(items)
-            
+            all_items = scan_common_paths()
             display_results(all_items)
             if all_items:
                 preview_small_files(all_items)
@@ -238,21 +733,13 @@ def main():
             print("1. Enter specific path")
             print("2. Type 'auto' for smart scanning")
             print("3. Type '.' for current directory")
-            scan_path = input("Choose option: ").strip()
+            scan_path = read_input("Choose option: ").strip()
         except (EOFError, KeyboardInterrupt):
             print("\nExiting...")
             return
         
         if scan_path.lower() in ['auto', 'common', 'smart']:
-            print("\nScanning common hiding locations...")
-            common_paths = get_common_paths()
-            all_items = []
-            
-            for path in common_paths:
-                print("Checking: " + path)
-                items = scan_directory(path)
-                all_items.extend(items)
-            
+            all_items = scan_common_paths()
             display_results(all_items)
             if all_items:
                 preview_small_files(all_items)
@@ -262,7 +749,7 @@ def main():
             scan_path = "."
     
     # Scan for hidden files
-    hidden_items = scan_directory(scan_path)
+    hidden_items = list(scan_directory(scan_path))
     
     # Display results
     display_results(hidden_items)
@@ -273,7 +760,7 @@ def main():
         
         # Ask about saving report
         try:
-            save_choice = input("\nSave report to file? (y/n): ").lower().strip()
+            save_choice = read_input("\nSave report to file? (y/n): ").lower().strip()
             if save_choice == 'y' or save_choice == 'yes':
                 save_report(hidden_items, "hidden_files_report.txt")
         except (EOFError, KeyboardInterrupt):